@@ -0,0 +1,487 @@
+import functools
+import hashlib
+import json
+import os
+import re
+import time
+from datetime import datetime, timedelta, timezone
+import boto3
+from botocore.config import Config
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# orjson is optional; fall back to the standard library encoder without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+class _OrjsonModule:
+    """Stand-in for the json module that decodes with orjson."""
+
+    @staticmethod
+    def loads(s, **kwargs):
+        # orjson takes no decoder options, so defer to json when any are given
+        if kwargs:
+            return json.loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def __getattr__(self, name):
+        return getattr(json, name)
+
+# Let botocore decode JSON protocol responses with orjson as well
+if orjson is not None:
+    import botocore.parsers
+    botocore.parsers.json = _OrjsonModule()
+
+# Shared client configuration: a larger connection pool so concurrent calls
+# are not serialized, and adaptive retries to back off smoothly when throttled
+BOTO_CONFIG = Config(
+    max_pool_connections=50,
+    retries={'max_attempts': 10, 'mode': 'adaptive'},
+    tcp_keepalive=True
+)
+
+# Background prefetches are best effort; a failure only means the dashboard is
+# written without the unchanged-body check
+PREFETCH_CONFIG = BOTO_CONFIG.merge(Config(
+    retries={'max_attempts': 2, 'mode': 'standard'},
+    connect_timeout=5,
+    read_timeout=10
+))
+
+@functools.lru_cache(maxsize=1)
+def _get_session() -> boto3.session.Session:
+    """Get the session shared by every client, creating it on first use.
+
+    One session means credentials and endpoint data are resolved once. It is
+    created lazily so profile errors surface inside the callers' error handling.
+    """
+    return boto3.session.Session()
+
+def dumps_json(obj) -> str:
+    """Serialize an object to a JSON string, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+def body_digest(body: str) -> bytes:
+    """Hash a dashboard body so an unchanged dashboard can be detected."""
+    return hashlib.blake2b(body.encode(), digest_size=16).digest()
+
+def get_volume_details(volume: Dict) -> Dict:
+    """Get detailed information from an already-fetched volume description."""
+    name_tag = next((tag['Value'] for tag in volume.get('Tags', []) 
+                    if tag['Key'] == 'Name'), None)
+    return {
+        'name_tag': name_tag,
+        'iops': volume.get('Iops', 3000),  # Default for gp3
+        'throughput': volume.get('Throughput', 125)  # Default for gp3 in MB/s
+    }
+
+# Widget JSON templates, built once at import. compile_widget_formatter inlines
+# them into a compiled f-string whose placeholders take JSON-encoded values
+_IOPS_TEMPLATE_JSON = (
+    '{{"metrics":['
+    '[{{"expression":"(m1+m2)/(60-m3)","label":"Expression1","id":"e1","region":{region}}}],'
+    '["AWS/EBS","VolumeReadOps","VolumeId",{volume_id},{{"id":"m1","visible":false,"region":{region}}}],'
+    '[".","VolumeWriteOps",".",".",{{"id":"m2","visible":false,"region":{region}}}],'
+    '[".","VolumeIdleTime",".",".",{{"id":"m3","visible":false,"region":{region}}}]],'
+    '"view":"timeSeries","stacked":false,"region":{region},"stat":"Sum","period":60,'
+    '"title":{title},'
+    '"annotations":{{"horizontal":[{{"value":{limit},"fill":"below"}}]}}}}'
+)
+
+_THROUGHPUT_TEMPLATE_JSON = (
+    '{{"sparkline":true,"metrics":['
+    '[{{"expression":"(m1+m2)/(60-m3)","label":"Expression1","id":"e1","period":60,"stat":"Sum","region":{region}}}],'
+    '["AWS/EBS","VolumeReadBytes","VolumeId",{volume_id},{{"id":"m1","visible":false,"region":{region}}}],'
+    '[".","VolumeWriteBytes",".",".",{{"id":"m2","visible":false,"region":{region}}}],'
+    '[".","VolumeIdleTime",".",".",{{"id":"m3","visible":false,"region":{region}}}]],'
+    '"view":"timeSeries","stacked":false,"region":{region},"stat":"Sum","period":60,'
+    '"yAxis":{{"left":{{"min":0}}}},'
+    '"liveData":false,"singleValueFullPrecision":false,"setPeriodToTimeRange":true,'
+    '"title":{title},'
+    '"annotations":{{"horizontal":[{{"value":{limit},"fill":"below"}}]}}}}'
+)
+
+_WIDGET_TEMPLATE_JSON = '{{"type":"metric","width":12,"height":6,"properties":{properties}}}'
+
+def compile_widget_formatter(template: str, region: str) -> Callable[[str, str, int], str]:
+    """Compile a widget template into a renderer with the region inlined.
+
+    The returned function takes the JSON-encoded volume ID and title plus the
+    annotation limit and returns the complete metric widget as JSON text.
+    """
+    region_literal = (dumps_json(region)
+                      .replace('\\', '\\\\').replace("'", "\\'")
+                      .replace('{', '{{').replace('}', '}}'))
+    body = _WIDGET_TEMPLATE_JSON.replace('{properties}', template).replace('{region}', region_literal)
+    source = f"def render(volume_id, title, limit):\n    return f'''{body}'''\n"
+    namespace = {}
+    exec(compile(source, '<widget-formatter>', 'exec'), namespace)
+    return namespace['render']
+
+def _widget_pair(volume: Dict, drive_name: str, render_iops: Callable, render_throughput: Callable) -> Iterator[str]:
+    """Yield the IOPS and throughput widget JSON for a single volume."""
+    volume_id = volume['VolumeId']
+    volume_json = dumps_json(volume_id)
+    yield render_iops(
+        volume_json,
+        dumps_json(f"IOPS - {volume_id}_{drive_name}"),
+        int(volume['Iops'])
+    )
+    yield render_throughput(
+        volume_json,
+        dumps_json(f"Throughput - {volume_id}_{drive_name}"),
+        # Convert throughput from MB/s to Bytes/s
+        int(volume['Throughput']) << 20
+    )
+
+class PlainConsole:
+    """Plain-text console output and prompts used by the dashboard generator."""
+
+    def status(self, message: str) -> None:
+        print(message)
+
+    # Plain output does not distinguish these kinds of status lines
+    step = fetch_step = success = error = invalid = status
+
+    def warning(self, message: str) -> None:
+        print(f"\n{message}")
+
+    def banner(self, title: str) -> None:
+        print("\n*************************************************************************")
+        print(f"*************** {title} *********************")
+        print("*************************************************************************")
+
+    def heading(self, title: str) -> None:
+        print(f"\n{title}")
+
+    subheading = heading
+
+    def section(self, title: str) -> None:
+        print(title)
+        print("=" * 60)
+
+    def field(self, label: str, value) -> None:
+        print(f"{label}: {value}")
+
+    def item(self, index: int, text: str) -> None:
+        print(f"{index}. {text}")
+
+    def prompt(self, message: str) -> str:
+        return input(f"{message} ")
+
+    def progress(self, iterable: Iterable, desc: str) -> Iterable:
+        return iterable
+
+class EBSDashboardGenerator:
+    def __init__(self, region: str, console: Optional[PlainConsole] = None):
+        self.region = region
+        self.console = console or PlainConsole()
+        self.console.step("Initializing AWS clients...")
+        session = _get_session()
+        self.ec2_client = session.client('ec2', region_name=region, config=BOTO_CONFIG)
+        self.cloudwatch_client = session.client('cloudwatch', region_name=region, config=BOTO_CONFIG)
+        # Separate client for the background dashboard prefetch, with few retries
+        # and short timeouts so an abandoned prefetch cannot hold up exit
+        self._prefetch_client = session.client('cloudwatch', region_name=region, config=PREFETCH_CONFIG)
+
+    def get_volume_info(self, instance_id: str) -> List[Dict]:
+        """Get all volumes attached to an EC2 instance with their details."""
+        volumes = []
+        
+        try:
+            self.console.fetch_step("Fetching EBS volumes...")
+            paginator = self.ec2_client.get_paginator('describe_volumes')
+            pages = paginator.paginate(
+                Filters=[{
+                    'Name': 'attachment.instance-id',
+                    'Values': [instance_id]
+                }],
+                PaginationConfig={'PageSize': 200}
+            )
+            attached_volumes = [volume for page in pages for volume in page['Volumes']]
+            
+            for volume in attached_volumes:
+                device_name = volume['Attachments'][0]['Device']
+                volume_details = get_volume_details(volume)
+                volumes.append({
+                    'VolumeId': volume['VolumeId'],
+                    'DeviceName': device_name,
+                    'Size': volume['Size'],
+                    'NameTag': volume_details['name_tag'],
+                    'Iops': volume_details['iops'],
+                    'Throughput': volume_details['throughput']
+                })
+            
+            return volumes
+            
+        except Exception as e:
+            self.console.error(f"Error getting volume information: {str(e)}")
+            return []
+
+    def get_volumes_with_data(self, volumes: List[Dict]) -> List[Dict]:
+        """Keep only volumes that reported EBS metrics during the last hour."""
+        end_time = datetime.now(timezone.utc)
+        start_time = end_time - timedelta(hours=1)
+        volumes_with_data = set()
+        
+        try:
+            self.console.fetch_step("Checking volume metrics...")
+            paginator = self.cloudwatch_client.get_paginator('get_metric_data')
+            # get_metric_data accepts up to 500 queries per request
+            for offset in range(0, len(volumes), 500):
+                batch = volumes[offset:offset + 500]
+                queries = [{
+                    'Id': f"q{i}",
+                    'MetricStat': {
+                        'Metric': {
+                            'Namespace': 'AWS/EBS',
+                            'MetricName': 'VolumeIdleTime',
+                            'Dimensions': [{'Name': 'VolumeId', 'Value': volume['VolumeId']}]
+                        },
+                        'Period': 3600,
+                        'Stat': 'SampleCount'
+                    }
+                } for i, volume in enumerate(batch)]
+                
+                for page in paginator.paginate(
+                    MetricDataQueries=queries,
+                    StartTime=start_time,
+                    EndTime=end_time
+                ):
+                    for result in page['MetricDataResults']:
+                        if result['Values']:
+                            volumes_with_data.add(batch[int(result['Id'][1:])]['VolumeId'])
+        except Exception as e:
+            self.console.error(f"Error checking volume metrics, keeping all volumes: {str(e)}")
+            return volumes
+        
+        for volume in volumes:
+            if volume['VolumeId'] not in volumes_with_data:
+                self.console.warning(f"Skipping {volume['VolumeId']}: no metric data in the last hour")
+        return [volume for volume in volumes if volume['VolumeId'] in volumes_with_data]
+
+    def get_drive_names(self, volumes: List[Dict]) -> Dict[str, str]:
+        """Get drive names from tags, prompting once for all untagged volumes."""
+        drive_names = {}
+        untagged_volumes = []
+        
+        self.console.section("Collecting drive names for volumes:")
+        
+        for volume in volumes:
+            volume_id = volume['VolumeId']
+            name_tag = volume['NameTag']
+            
+            self.console.subheading("Volume Details:")
+            self.console.field("Volume ID", volume_id)
+            self.console.field("Device Name", volume['DeviceName'])
+            self.console.field("Size", f"{volume['Size']} GB")
+            
+            if name_tag:
+                self.console.success(f"Using name from tag: {name_tag}")
+                drive_names[volume_id] = name_tag
+            else:
+                untagged_volumes.append(volume)
+        
+        if untagged_volumes:
+            self.console.subheading("Volumes without a Name tag:")
+            for i, volume in enumerate(untagged_volumes, 1):
+                self.console.item(i, f"{volume['VolumeId']} ({volume['DeviceName']})")
+            
+            while True:
+                entered = self.console.prompt("Enter drive names for these volumes in order, comma-separated (e.g., SYSDB,DATA):")
+                names = [name.strip() for name in entered.split(',')]
+                if len(names) != len(untagged_volumes):
+                    self.console.invalid(f"Expected {len(untagged_volumes)} drive names but got {len(names)}. Please try again.")
+                elif not all(names):
+                    self.console.invalid("Drive names cannot be empty. Please try again.")
+                else:
+                    break
+            
+            for volume, name in zip(untagged_volumes, names):
+                drive_names[volume['VolumeId']] = name
+                
+        return drive_names
+
+    def _fetch_dashboard_body(self, dashboard_name: str) -> Optional[str]:
+        """Get the body of an existing dashboard, or None if it cannot be read."""
+        try:
+            response = self._prefetch_client.get_dashboard(DashboardName=dashboard_name)
+            return response['DashboardBody']
+        except Exception:
+            # The dashboard may not exist yet; it will simply be created
+            return None
+
+    def build_dashboard_body(self, volumes: List[Dict], drive_names: Dict[str, str]) -> str:
+        """Build the dashboard body JSON for the given volumes."""
+        render_iops = compile_widget_formatter(_IOPS_TEMPLATE_JSON, self.region)
+        render_throughput = compile_widget_formatter(_THROUGHPUT_TEMPLATE_JSON, self.region)
+        widgets = ','.join(
+            widget
+            for volume in self.console.progress(volumes, desc="Processing volumes")
+            for widget in _widget_pair(volume, drive_names[volume['VolumeId']], render_iops, render_throughput)
+        )
+        return '{"widgets":[' + widgets + ']}'
+
+    def create_dashboard(self, instance_id: str, dashboard_name: str) -> None:
+        """Create or update CloudWatch dashboard for all volumes attached to an instance."""
+        # Fetch the current dashboard while volumes are looked up and named
+        executor = ThreadPoolExecutor(max_workers=1)
+        existing_body_future = executor.submit(self._fetch_dashboard_body, dashboard_name)
+        try:
+            volumes = self.get_volume_info(instance_id)
+            if not volumes:
+                self.console.error(f"No volumes found for instance {instance_id}")
+                return
+                
+            self.console.success(f"Found {len(volumes)} volumes attached to instance {instance_id}")
+            
+            volumes = self.get_volumes_with_data(volumes)
+            if not volumes:
+                self.console.error(f"No volumes with metric data found for instance {instance_id}")
+                return
+            
+            drive_names = self.get_drive_names(volumes)
+            
+            self.console.step("Generating dashboard widgets...")
+            dashboard_body = self.build_dashboard_body(volumes, drive_names)
+            existing_body = existing_body_future.result()
+            if existing_body is not None and body_digest(existing_body) == body_digest(dashboard_body):
+                self.console.success(f"Dashboard {dashboard_name} is already up to date")
+                return
+            
+            self.console.step("Creating CloudWatch dashboard...")
+            self.cloudwatch_client.put_dashboard(
+                DashboardName=dashboard_name,
+                DashboardBody=dashboard_body
+            )
+            
+            self.console.success(f"Successfully created/updated dashboard: {dashboard_name}")
+            
+        except self.ec2_client.exceptions.ClientError as e:
+            self.console.error(f"AWS API Error: {str(e)}")
+        except Exception as e:
+            self.console.error(f"Error: {str(e)}")
+        finally:
+            # Don't wait on an unfinished prefetch when returning early or on Ctrl-C
+            existing_body_future.cancel()
+            executor.shutdown(wait=False)
+
+# Regions rarely change, so keep the describe_regions result on disk for a day.
+# Opt-in regions differ per account, so the cache is kept per AWS profile
+REGIONS_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'ebs-dashboard')
+REGIONS_CACHE_TTL = 24 * 60 * 60
+
+def regions_cache_file() -> str:
+    """Get the region cache path for the active AWS profile."""
+    # Same lookup order botocore uses to pick the profile
+    profile = os.environ.get('AWS_DEFAULT_PROFILE') or os.environ.get('AWS_PROFILE') or 'default'
+    safe_profile = re.sub(r'[^A-Za-z0-9_.-]', '_', profile)
+    return os.path.join(REGIONS_CACHE_DIR, f"regions-{safe_profile}.json")
+
+def load_cached_regions() -> Optional[List[str]]:
+    """Load the region list from the disk cache if it is still fresh."""
+    cache_file = regions_cache_file()
+    try:
+        if time.time() - os.path.getmtime(cache_file) > REGIONS_CACHE_TTL:
+            return None
+        with open(cache_file) as f:
+            regions = json.load(f)
+        if isinstance(regions, list) and regions:
+            return regions
+    except (OSError, ValueError):
+        pass
+    return None
+
+def save_cached_regions(regions: List[str]) -> None:
+    """Write the region list to the disk cache, ignoring filesystem errors."""
+    try:
+        os.makedirs(REGIONS_CACHE_DIR, exist_ok=True)
+        with open(regions_cache_file(), 'w') as f:
+            json.dump(regions, f)
+    except OSError:
+        pass
+
+@functools.lru_cache(maxsize=1)
+def _describe_regions() -> Tuple[str, ...]:
+    """Fetch region names from EC2 and store them in the disk cache."""
+    ec2_client = _get_session().client('ec2', region_name='us-east-1', config=BOTO_CONFIG)
+    response = ec2_client.describe_regions()
+    regions = [region['RegionName'] for region in response['Regions']]
+    save_cached_regions(regions)
+    return tuple(regions)
+
+def get_aws_regions(console: Optional[PlainConsole] = None) -> List[str]:
+    """Get list of available AWS regions."""
+    console = console or PlainConsole()
+    # Only consult the disk cache and report progress before the first fetch
+    if not _describe_regions.cache_info().currsize:
+        cached_regions = load_cached_regions()
+        if cached_regions:
+            return cached_regions
+        console.fetch_step("Fetching AWS regions...")
+    try:
+        return list(_describe_regions())
+    except Exception as e:
+        console.error(f"Error fetching AWS regions: {str(e)}")
+        return ['us-east-1', 'us-east-2', 'us-west-1', 'us-west-2', 'eu-west-1']
+
+def get_user_inputs(console: Optional[PlainConsole] = None) -> tuple:
+    """Get user inputs for instance ID, region, and dashboard name."""
+    console = console or PlainConsole()
+    console.banner("Welcome to EBS Dashboard Generator!")
+    
+    regions = get_aws_regions(console)
+    console.heading("Available AWS regions:")
+    for i, region in enumerate(regions, 1):
+        console.item(i, region)
+    
+    while True:
+        try:
+            region_index = int(console.prompt("\nSelect region number:")) - 1
+            if 0 <= region_index < len(regions):
+                selected_region = regions[region_index]
+                break
+            console.invalid("Invalid selection. Please try again.")
+        except ValueError:
+            console.invalid("Please enter a valid number.")
+    
+    while True:
+        instance_id = console.prompt("\nEnter EC2 instance ID (e.g., i-0123456789abcdef0):").strip()
+        if instance_id.startswith('i-') and len(instance_id) > 2:
+            break
+        console.invalid("Invalid instance ID format. Must start with 'i-'. Please try again.")
+    
+    while True:
+        dashboard_name = console.prompt("\nEnter dashboard name:").strip()
+        if dashboard_name:
+            break
+        console.invalid("Dashboard name cannot be empty. Please try again.")
+    
+    return instance_id, selected_region, dashboard_name
+
+def main(console: Optional[PlainConsole] = None):
+    console = console or PlainConsole()
+    try:
+        instance_id, region, dashboard_name = get_user_inputs(console)
+        
+        console.heading("Summary of inputs:")
+        console.field("Instance ID", instance_id)
+        console.field("Region", region)
+        console.field("Dashboard Name", dashboard_name)
+        
+        confirm = console.prompt("\nProceed with these settings? (y/n):").strip().lower()
+        if confirm != 'y':
+            console.warning("Operation cancelled by user.")
+            return
+        
+        generator = EBSDashboardGenerator(region, console)
+        generator.create_dashboard(instance_id, dashboard_name)
+        
+    except KeyboardInterrupt:
+        console.warning("Operation cancelled by user.")
+    except Exception as e:
+        console.error(f"Error: {str(e)}")